@@ -9,7 +9,6 @@ import com.aminafi.smartfinance.domain.usecase.ProcessAIMessageUseCase
 import kotlinx.coroutines.ExperimentalCoroutinesApi
 import kotlinx.coroutines.flow.Flow
 import kotlinx.coroutines.flow.MutableStateFlow
-import kotlinx.coroutines.flow.StateFlow
 import kotlinx.coroutines.flow.asStateFlow
 import kotlinx.coroutines.flow.combine
 import kotlinx.coroutines.flow.flatMapLatest
@@ -77,25 +76,6 @@ class FinanceViewModel(
         return Triple(monthName, year, fullDate)
     }
 
-    private fun getCurrentMonthTransactionsFlow(): Flow<List<Transaction>> {
-        val calendar = Calendar.getInstance()
-        val currentMonth = calendar.get(Calendar.MONTH)
-        val currentYear = calendar.get(Calendar.YEAR)
-
-        // Set to first day of current month
-        calendar.set(currentYear, currentMonth, 1, 0, 0, 0)
-        val startOfMonth = calendar.timeInMillis
-
-        // Set to last day of current month
-        calendar.set(Calendar.DAY_OF_MONTH, calendar.getActualMaximum(Calendar.DAY_OF_MONTH))
-        calendar.set(Calendar.HOUR_OF_DAY, 23)
-        calendar.set(Calendar.MINUTE, 59)
-        calendar.set(Calendar.SECOND, 59)
-        val endOfMonth = calendar.timeInMillis
-
-        return transactionRepository.getTransactionsForMonth(startOfMonth, endOfMonth)
-    }
-
     // Add a new transaction
     fun addTransaction(transaction: Transaction) {
         viewModelScope.launch {
@@ -120,32 +100,18 @@ class FinanceViewModel(
     // Get monthly summary with both monthly and total balance
     fun getMonthlySummary(monthlyTransactions: List<Transaction>, allTransactions: List<Transaction>): FinancialSummary {
         // Monthly calculations
-        val monthlyIncome = monthlyTransactions
-            .filter { it.type == TransactionType.INCOME }
-            .sumOf { it.amount }
-
-        val monthlyExpenses = monthlyTransactions
-            .filter { it.type == TransactionType.EXPENSE }
-            .sumOf { it.amount }
-
-        val monthlySavings = monthlyTransactions
-            .filter { it.type == TransactionType.SAVINGS }
-            .sumOf { it.amount }
+        val monthlyTotals = sumByType(monthlyTransactions)
+        val monthlyIncome = monthlyTotals[TransactionType.INCOME.ordinal]
+        val monthlyExpenses = monthlyTotals[TransactionType.EXPENSE.ordinal]
+        val monthlySavings = monthlyTotals[TransactionType.SAVINGS.ordinal]
 
         val monthlyBalance = monthlyIncome - monthlyExpenses - monthlySavings
 
         // Total calculations (all time)
-        val totalIncome = allTransactions
-            .filter { it.type == TransactionType.INCOME }
-            .sumOf { it.amount }
-
-        val totalExpenses = allTransactions
-            .filter { it.type == TransactionType.EXPENSE }
-            .sumOf { it.amount }
-
-        val totalSavings = allTransactions
-            .filter { it.type == TransactionType.SAVINGS }
-            .sumOf { it.amount }
+        val allTimeTotals = sumByType(allTransactions)
+        val totalIncome = allTimeTotals[TransactionType.INCOME.ordinal]
+        val totalExpenses = allTimeTotals[TransactionType.EXPENSE.ordinal]
+        val totalSavings = allTimeTotals[TransactionType.SAVINGS.ordinal]
 
         val totalBalance = totalIncome - totalExpenses - totalSavings
 
@@ -161,6 +127,15 @@ class FinanceViewModel(
         )
     }
 
+    // Sum amounts per transaction type in a single pass, indexed by TransactionType.ordinal
+    private fun sumByType(transactions: List<Transaction>): DoubleArray {
+        val totals = DoubleArray(TransactionType.values().size)
+        for (transaction in transactions) {
+            totals[transaction.type.ordinal] += transaction.amount
+        }
+        return totals
+    }
+
     // Process AI message and detect transaction
     suspend fun processAIMessage(message: String): Result<AIDetectedTransaction> {
         return processAIMessageUseCase(message)
@@ -6,7 +6,6 @@ import com.aminafi.smartfinance.ai.analyzers.TitleGenerator
 import com.aminafi.smartfinance.ai.analyzers.TitleGeneratorInterface
 import com.aminafi.smartfinance.ai.analyzers.TransactionTypeAnalyzer
 import com.aminafi.smartfinance.ai.analyzers.TransactionTypeAnalyzerInterface
-import kotlinx.coroutines.delay
 
 /**
  * Advanced Pattern-Based Transaction Detection Service
@@ -26,9 +25,6 @@ class SimpleTransactionAIService(
 ) : TransactionAIService {
 
     override suspend fun detectTransaction(message: String): Result<AIDetectedTransaction> {
-        // Simulate AI processing delay (realistic for complex pattern analysis)
-        delay((50..150).random().toLong())
-
         val lowerMessage = message.lowercase().trim()
 
         // Extract amount using dedicated analyzer
@@ -52,10 +48,13 @@ class SimpleTransactionAIService(
             confidence = 0.85 // High confidence from advanced analysis
         )
 
-        println("🎯 ADVANCED AI Detection: '$message'")
-        println("   → Type: ${transactionType.name}")
-        println("   → Amount: $${amount}")
-        println("   → Confidence: 85% (Advanced Contextual Analysis)")
+        // Single write instead of one stdout call per line
+        println(
+            "🎯 ADVANCED AI Detection: '$message'\n" +
+            "   → Type: ${transactionType.name}\n" +
+            "   → Amount: $${amount}\n" +
+            "   → Confidence: 85% (Advanced Contextual Analysis)"
+        )
 
         return Result.success(transaction)
     }
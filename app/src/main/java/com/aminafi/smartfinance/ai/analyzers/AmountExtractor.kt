@@ -11,21 +11,7 @@ class AmountExtractor : AmountExtractorInterface {
      * Extract monetary amount from text
      */
     override fun extractAmount(text: String): Double {
-        // Multiple regex patterns for different amount formats
-        val patterns = listOf(
-            Regex("(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)\\s*(?:dollars?|bucks?|usd|\\$)"),
-            Regex("\\$(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)"),
-            Regex("(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)\\s*(?:rupees?|rs|₹|inr)"),
-            Regex("₹(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)"),
-            Regex("(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)\\s*(?:euros?|eur|€)"),
-            Regex("€(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)"),
-            Regex("(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)\\s*(?:pounds?|gbp|£)"),
-            Regex("£(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)"),
-            // Fallback: any number
-            Regex("(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)")
-        )
-
-        for (pattern in patterns) {
+        for (pattern in AMOUNT_PATTERNS) {
             val match = pattern.find(text)
             if (match != null) {
                 val amountStr = match.groupValues[1].replace(",", "")
@@ -38,4 +24,20 @@ class AmountExtractor : AmountExtractorInterface {
 
         return 0.0
     }
+
+    companion object {
+        // Multiple regex patterns for different amount formats, compiled once per process
+        private val AMOUNT_PATTERNS = listOf(
+            Regex("(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)\\s*(?:dollars?|bucks?|usd|\\$)"),
+            Regex("\\$(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)"),
+            Regex("(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)\\s*(?:rupees?|rs|₹|inr)"),
+            Regex("₹(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)"),
+            Regex("(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)\\s*(?:euros?|eur|€)"),
+            Regex("€(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)"),
+            Regex("(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)\\s*(?:pounds?|gbp|£)"),
+            Regex("£(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)"),
+            // Fallback: any number
+            Regex("(\\d+(?:,\\d{3})*(?:\\.\\d{1,2})?)")
+        )
+    }
 }
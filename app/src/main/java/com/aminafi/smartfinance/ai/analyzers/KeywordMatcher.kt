@@ -0,0 +1,88 @@
+package com.aminafi.smartfinance.ai.analyzers
+
+/**
+ * Aho-Corasick keyword matcher following Single Responsibility Principle
+ * Finds every registered keyword occurring in a text with one left-to-right pass,
+ * instead of one String.contains scan per keyword
+ */
+class KeywordMatcher(keywords: Iterable<String>) {
+
+    // Trie edges per state; state 0 is the root
+    private val transitions = mutableListOf(HashMap<Char, Int>())
+
+    // Longest proper suffix of each state that is also a trie state
+    private val failureLinks = mutableListOf(0)
+
+    // Keywords ending at each state, including those reachable through failure links
+    private val outputs = mutableListOf(mutableListOf<String>())
+
+    private val registered: Set<String> = keywords.filter { it.isNotEmpty() }.toSet()
+
+    init {
+        registered.forEach(::insert)
+        buildFailureLinks()
+    }
+
+    /**
+     * Scan text once and return a view answering keyword containment from the scan
+     */
+    fun scan(text: String): ScannedText {
+        val found = HashSet<String>()
+        var state = 0
+        for (char in text) {
+            state = nextState(state, char)
+            found.addAll(outputs[state])
+        }
+        return ScannedText(text, registered, found)
+    }
+
+    private fun insert(keyword: String) {
+        var state = 0
+        for (char in keyword) {
+            state = transitions[state].getOrPut(char) {
+                transitions.add(HashMap())
+                failureLinks.add(0)
+                outputs.add(mutableListOf())
+                transitions.size - 1
+            }
+        }
+        outputs[state].add(keyword)
+    }
+
+    private fun buildFailureLinks() {
+        // Breadth-first so every parent's failure link is final before its children use it
+        val queue = ArrayDeque(transitions[0].values)
+        while (queue.isNotEmpty()) {
+            val state = queue.removeFirst()
+            for ((char, child) in transitions[state]) {
+                val fallback = nextState(failureLinks[state], char)
+                failureLinks[child] = fallback
+                outputs[child].addAll(outputs[fallback])
+                queue.addLast(child)
+            }
+        }
+    }
+
+    private fun nextState(state: Int, char: Char): Int {
+        var current = state
+        while (true) {
+            transitions[current][char]?.let { return it }
+            if (current == 0) return 0
+            current = failureLinks[current]
+        }
+    }
+}
+
+/**
+ * Text already scanned by a [KeywordMatcher]
+ * Registered keywords are answered from the scan; anything else falls back to String.contains
+ */
+class ScannedText(
+    val text: String,
+    private val registered: Set<String>,
+    private val found: Set<String>
+) {
+    operator fun contains(keyword: String): Boolean {
+        return if (keyword in registered) keyword in found else text.contains(keyword)
+    }
+}
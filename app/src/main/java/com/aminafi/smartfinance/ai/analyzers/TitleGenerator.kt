@@ -13,59 +13,12 @@ class TitleGenerator : TitleGeneratorInterface {
      * Generate intelligent transaction title from text
      */
     override fun generateTitle(text: String, type: TransactionType): String {
-        val lowerText = text.lowercase()
+        val scanned = KEYWORD_MATCHER.scan(text.lowercase())
 
-        // Category detection based on keywords
-        val title = when {
-            // Food & Dining
-            lowerText.contains("food") || lowerText.contains("lunch") ||
-            lowerText.contains("dinner") || lowerText.contains("restaurant") ||
-            lowerText.contains("coffee") || lowerText.contains("groceries") -> {
-                "Food & Dining"
-            }
-
-            // Transportation
-            lowerText.contains("gas") || lowerText.contains("fuel") ||
-            lowerText.contains("transport") || lowerText.contains("taxi") ||
-            lowerText.contains("uber") || lowerText.contains("bus") -> {
-                "Transportation"
-            }
-
-            // Entertainment
-            lowerText.contains("movie") || lowerText.contains("cinema") ||
-            lowerText.contains("entertainment") || lowerText.contains("tickets") -> {
-                "Entertainment"
-            }
-
-            // Shopping
-            lowerText.contains("clothes") || lowerText.contains("shirt") ||
-            lowerText.contains("tshirt") || lowerText.contains("shoes") ||
-            lowerText.contains("shopping") -> {
-                "Shopping"
-            }
-
-            // Bills & Utilities
-            lowerText.contains("bill") || lowerText.contains("electricity") ||
-            lowerText.contains("water") || lowerText.contains("internet") ||
-            lowerText.contains("phone") || lowerText.contains("rent") -> {
-                "Bills & Utilities"
-            }
-
-            // Salary
-            lowerText.contains("salary") || lowerText.contains("payroll") -> {
-                "Salary"
-            }
-
-            // Freelance Income
-            lowerText.contains("freelance") || lowerText.contains("client") -> {
-                "Freelance Income"
-            }
-
-            // Default fallback
-            else -> getDefaultTitle(type)
-        }
-
-        return title
+        // Category detection based on keywords; first matching category wins
+        return CATEGORY_KEYWORDS.firstOrNull { (_, keywords) ->
+            keywords.any { scanned.contains(it) }
+        }?.first ?: getDefaultTitle(type)
     }
 
     private fun getDefaultTitle(type: TransactionType): String {
@@ -75,4 +28,20 @@ class TitleGenerator : TitleGeneratorInterface {
             TransactionType.SAVINGS -> "Savings Transaction"
         }
     }
+
+    companion object {
+        // Title to keywords, in priority order
+        private val CATEGORY_KEYWORDS = listOf(
+            "Food & Dining" to listOf("food", "lunch", "dinner", "restaurant", "coffee", "groceries"),
+            "Transportation" to listOf("gas", "fuel", "transport", "taxi", "uber", "bus"),
+            "Entertainment" to listOf("movie", "cinema", "entertainment", "tickets"),
+            "Shopping" to listOf("clothes", "shirt", "tshirt", "shoes", "shopping"),
+            "Bills & Utilities" to listOf("bill", "electricity", "water", "internet", "phone", "rent"),
+            "Salary" to listOf("salary", "payroll"),
+            "Freelance Income" to listOf("freelance", "client")
+        )
+
+        // Single-pass matcher over every category keyword
+        private val KEYWORD_MATCHER = KeywordMatcher(CATEGORY_KEYWORDS.flatMap { it.second })
+    }
 }
@@ -1,7 +1,6 @@
 package com.aminafi.smartfinance.ai.analyzers
 
 import com.aminafi.smartfinance.TransactionType
-import kotlin.math.max
 import kotlin.math.min
 
 /**
@@ -16,14 +15,17 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
      */
     override fun analyzeTransactionType(text: String): TransactionType {
         val lowerText = text.lowercase()
-        val words = lowerText.split("\\s+".toRegex()).map { it.lowercase().trim() }
+        // Tokenized once here and reused by every word-level analysis
+        val words = lowerText.split(WHITESPACE)
+        // Single keyword pass shared by every substring check below
+        val scanned = KEYWORD_MATCHER.scan(lowerText)
 
         var incomeScore = 0
         var expenseScore = 0
 
         // Direct category words (highest priority)
-        incomeScore += analyzeDirectCategoryWords(lowerText)
-        expenseScore += analyzeDirectExpenseWords(lowerText)
+        incomeScore += analyzeDirectCategoryWords(scanned)
+        expenseScore += analyzeDirectExpenseWords(scanned)
 
         // Preposition-based analysis
         val prepositionResult = analyzePrepositions(words, lowerText)
@@ -36,68 +38,58 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         expenseScore += svoResult.expenseScore
 
         // Gift and reward patterns
-        incomeScore += analyzeGiftPatterns(lowerText)
+        incomeScore += analyzeGiftPatterns(scanned)
 
         // Family relationship patterns
-        incomeScore += analyzeFamilyPatterns(lowerText)
+        incomeScore += analyzeFamilyPatterns(scanned)
 
         // Direct money flow patterns
-        val flowResult = analyzeMoneyFlowPatterns(lowerText)
+        val flowResult = analyzeMoneyFlowPatterns(scanned)
         incomeScore += flowResult.incomeScore
         expenseScore += flowResult.expenseScore
 
         // Receiving and giving patterns
-        val patternResult = analyzeReceivingGivingPatterns(lowerText)
+        val patternResult = analyzeReceivingGivingPatterns(scanned)
         incomeScore += patternResult.incomeScore
         expenseScore += patternResult.expenseScore
 
         // Possessive context analysis
-        val possessiveResult = analyzePossessiveContext(words, lowerText)
+        val possessiveResult = analyzePossessiveContext(words, scanned)
         incomeScore += possessiveResult.incomeScore
         expenseScore += possessiveResult.expenseScore
 
         // Semantic verb analysis
-        val semanticResult = analyzeSemanticVerbs(words, lowerText)
+        val semanticResult = analyzeSemanticVerbs(words, scanned)
         incomeScore += semanticResult.incomeScore
         expenseScore += semanticResult.expenseScore
 
-        return determineFinalType(incomeScore, expenseScore, lowerText, words)
+        return determineFinalType(incomeScore, expenseScore, scanned, words)
     }
 
-    private fun analyzeDirectCategoryWords(text: String): Int {
-        return if (text.contains("income") || text.contains("salary") ||
-            text.contains("earning") || text.contains("revenue") ||
-            text.contains("profit") || text.contains("bonus") ||
-            text.contains("commission")) {
+    private fun analyzeDirectCategoryWords(text: ScannedText): Int {
+        return if (DIRECT_INCOME_WORDS.any { text.contains(it) }) {
             println("🎯 DIRECT INCOME WORD: Strong INCOME signal (+5)")
             5
         } else 0
     }
 
-    private fun analyzeDirectExpenseWords(text: String): Int {
+    private fun analyzeDirectExpenseWords(text: ScannedText): Int {
         var expenseScore = 0
 
         // Direct expense keywords
-        if (text.contains("expense") || text.contains("cost") ||
-            text.contains("spending") || text.contains("payment") ||
-            text.contains("bill") || text.contains("fee")) {
+        if (DIRECT_EXPENSE_WORDS.any { text.contains(it) }) {
             println("🎯 DIRECT EXPENSE WORD: Strong EXPENSE signal (+5)")
             expenseScore += 5
         }
 
         // Shopping and purchase keywords
-        if (text.contains("shopping") || text.contains("shop") ||
-            text.contains("bought") || text.contains("purchase") ||
-            text.contains("buy") || text.contains("bought")) {
+        if (SHOPPING_KEYWORDS.any { text.contains(it) }) {
             println("🛒 SHOPPING DETECTED: Strong EXPENSE signal (+4)")
             expenseScore += 4
         }
 
         // Loss-related keywords (lost, missing, stolen, etc.)
-        if (text.contains("lost") || text.contains("missing") ||
-            text.contains("stolen") || text.contains("theft") ||
-            text.contains("robbed") || text.contains("gone") ||
-            text.contains("disappeared")) {
+        if (LOSS_WORDS.any { text.contains(it) }) {
             println("💸 LOSS DETECTED: Money lost/stolen = EXPENSE (+4)")
             expenseScore += 4
         }
@@ -110,7 +102,7 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         var expenseScore = 0
 
         val prepositionIndices = words.mapIndexedNotNull { index, word ->
-            if (word in listOf("to", "from", "by", "with", "for")) index to word else null
+            if (word in PREPOSITIONS) index to word else null
         }
 
         for ((prepIndex, preposition) in prepositionIndices) {
@@ -158,9 +150,8 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         var incomeScore = 0
         var expenseScore = 0
 
-        val actionVerbs = listOf("got", "gave", "paid", "received", "spent", "bought", "sent", "earned")
         val verbIndices = words.mapIndexedNotNull { index, word ->
-            if (word in actionVerbs) index to word else null
+            if (word in ACTION_VERBS) index to word else null
         }
 
         for ((verbIndex, verb) in verbIndices) {
@@ -223,33 +214,27 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         return ScoreResult(incomeScore, expenseScore)
     }
 
-    private fun analyzeGiftPatterns(text: String): Int {
-        return if (text.contains("gift") || text.contains("present") ||
-            text.contains("donation") || text.contains("prize") ||
-            text.contains("award") || text.contains("bonus") ||
-            text.contains("reward")) {
+    private fun analyzeGiftPatterns(text: ScannedText): Int {
+        return if (GIFT_WORDS.any { text.contains(it) }) {
             println("🤖 GIFT/REWARD DETECTED: Strong INCOME signal (+4)")
             4
         } else 0
     }
 
-    private fun analyzeFamilyPatterns(text: String): Int {
-        val familyWords = listOf("father", "mother", "dad", "mom", "parent", "brother", "sister", "son", "daughter", "uncle", "aunt", "grandfather", "grandmother")
-        val hasFamilyRelation = familyWords.any { text.contains(it) }
+    private fun analyzeFamilyPatterns(text: ScannedText): Int {
+        val hasFamilyRelation = FAMILY_WORDS.any { text.contains(it) }
         return if (hasFamilyRelation && (text.contains("got") || text.contains("received") || text.contains("money"))) {
             println("🤖 FAMILY MONEY: Money from family member = INCOME (+3)")
             3
         } else 0
     }
 
-    private fun analyzeMoneyFlowPatterns(text: String): ScoreResult {
+    private fun analyzeMoneyFlowPatterns(text: ScannedText): ScoreResult {
         var incomeScore = 0
         var expenseScore = 0
 
         // Money coming to me patterns
-        if (text.contains("gave me") || text.contains("gave to me") ||
-            text.contains("lent me") || text.contains("paid me") ||
-            text.contains("sent me")) {
+        if (MONEY_TO_ME_PATTERNS.any { text.contains(it) }) {
             incomeScore += 3
             println("🤖 DIRECT: Money coming TO me (+3)")
         }
@@ -259,8 +244,7 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
             expenseScore += 3
             println("🤖 DIRECT: Money going FROM me (+3)")
         }
-        if (text.contains("gave away") || text.contains("lent to") ||
-            text.contains("paid to") || text.contains("sent to")) {
+        if (MONEY_FROM_ME_PATTERNS.any { text.contains(it) }) {
             expenseScore += 3
             println("🤖 DIRECT: Money going FROM me (+3)")
         }
@@ -268,30 +252,18 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         return ScoreResult(incomeScore, expenseScore)
     }
 
-    private fun analyzeReceivingGivingPatterns(text: String): ScoreResult {
+    private fun analyzeReceivingGivingPatterns(text: ScannedText): ScoreResult {
         var incomeScore = 0
         var expenseScore = 0
 
-        val receivingPatterns = listOf(
-            "got from", "received from", "got money", "money came",
-            "came from", "transfer to me", "deposit to",
-            "gift from", "present from", "donation from", "prize from",
-            "money from", "cash from", "payment from"
-        )
-
-        val givingPatterns = listOf(
-            "gave away", "paid out", "spent for", "cost for",
-            "transfer from", "withdrawal", "paid off"
-        )
-
-        for (pattern in receivingPatterns) {
+        for (pattern in RECEIVING_PATTERNS) {
             if (text.contains(pattern)) {
                 incomeScore += 2
                 println("🤖 RECEIVING: '$pattern'")
             }
         }
 
-        for (pattern in givingPatterns) {
+        for (pattern in GIVING_PATTERNS) {
             if (text.contains(pattern)) {
                 expenseScore += 2
                 println("🤖 GIVING: '$pattern'")
@@ -301,12 +273,12 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         return ScoreResult(incomeScore, expenseScore)
     }
 
-    private fun analyzePossessiveContext(words: List<String>, text: String): ScoreResult {
+    private fun analyzePossessiveContext(words: List<String>, text: ScannedText): ScoreResult {
         var incomeScore = 0
         var expenseScore = 0
 
-        if (words.contains("me") || words.contains("my") || words.contains("i")) {
-            val meIndex = words.indexOf("me")
+        val meIndex = words.indexOf("me")
+        if (meIndex >= 0 || words.contains("my") || words.contains("i")) {
             if (meIndex >= 0) {
                 val beforeMe = if (meIndex > 0) words[meIndex - 1] else ""
                 val afterMe = if (meIndex < words.size - 1) words[meIndex + 1] else ""
@@ -326,9 +298,7 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
                 println("🤖 POSSESSIVE: 'for myself/me' = personal purchase (EXPENSE)")
             }
 
-            if (text.contains("went to market") || text.contains("shopping") ||
-                text.contains("bought") || text.contains("purchase") ||
-                text.contains("shop") || text.contains("buy")) {
+            if (text.contains("went to market") || SHOPPING_KEYWORDS.any { text.contains(it) }) {
                 expenseScore += 3
                 println("🤖 CONTEXT: Shopping/market activity detected = EXPENSE (+3)")
             }
@@ -337,16 +307,13 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         return ScoreResult(incomeScore, expenseScore)
     }
 
-    private fun analyzeSemanticVerbs(words: List<String>, text: String): ScoreResult {
+    private fun analyzeSemanticVerbs(words: List<String>, text: ScannedText): ScoreResult {
         var incomeScore = 0
         var expenseScore = 0
 
-        val basicIncomeVerbs = listOf("received", "earned", "got")
-        val basicExpenseVerbs = listOf("paid", "spent", "bought")
-
-        for (verb in basicIncomeVerbs) {
-            if (words.contains(verb)) {
-                val verbIndex = words.indexOf(verb)
+        for (verb in BASIC_INCOME_VERBS) {
+            val verbIndex = words.indexOf(verb)
+            if (verbIndex >= 0) {
                 val contextWords = getContextWords(words, verbIndex, 3)
 
                 if (verb == "got" && isShoppingContext(text, contextWords)) {
@@ -362,7 +329,7 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
             }
         }
 
-        for (verb in basicExpenseVerbs) {
+        for (verb in BASIC_EXPENSE_VERBS) {
             if (words.contains(verb)) {
                 expenseScore += 1
                 println("🤖 VERB: '$verb' = EXPENSE (+1)")
@@ -372,56 +339,33 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         return ScoreResult(incomeScore, expenseScore)
     }
 
-    private fun analyzeSavingsPatterns(text: String): Int {
+    private fun analyzeSavingsPatterns(text: ScannedText, words: List<String>): Int {
         var savingsScore = 0
-        val lowerText = text.lowercase()
 
         // Direct savings keywords with weights
-        val savingsKeywords = mapOf(
-            "sav" to 2, "saving" to 2, "saved" to 3, "savings" to 4,
-            "deposit" to 3, "deposited" to 4, "bank" to 2, "account" to 2,
-            "put away" to 4, "set aside" to 4, "emergency" to 3, "fund" to 3,
-            "future" to 3, "long term" to 3, "accumulate" to 3, "build" to 2,
-            "invest" to 2, "investment" to 3, "retirement" to 3, "pension" to 3
-        )
-
-        for ((keyword, keywordWeight) in savingsKeywords) {
-            if (lowerText.contains(keyword)) {
+        for ((keyword, keywordWeight) in SAVINGS_KEYWORDS) {
+            if (text.contains(keyword)) {
                 savingsScore += keywordWeight
                 println("💰 SAVINGS: '$keyword' detected (+$keywordWeight)")
             }
         }
 
         // Money flow to bank/account patterns with context
-        val bankPatterns = listOf(
-            "to bank" to 4, "to savings" to 5, "to account" to 4,
-            "into savings" to 5, "into bank" to 4, "into account" to 4,
-            "bank account" to 3, "savings account" to 4,
-            "transfer to savings" to 5, "moved to bank" to 4
-        )
-
-        for ((pattern, patternWeight) in bankPatterns) {
-            if (lowerText.contains(pattern)) {
+        for ((pattern, patternWeight) in BANK_PATTERNS) {
+            if (text.contains(pattern)) {
                 savingsScore += patternWeight
                 println("🏦 BANK FLOW: '$pattern' detected (+$patternWeight)")
             }
         }
 
         // Smart context analysis
-        savingsScore += analyzeSavingsContext(lowerText)
+        savingsScore += analyzeSavingsContext(text, words)
 
         // Exclude payment patterns with smart detection
-        val exclusionPatterns = listOf(
-            "paid bill" to 5, "paid rent" to 5, "paid utilities" to 5,
-            "paid debt" to 5, "paid loan" to 5, "paid credit" to 5,
-            "bought" to 4, "purchase" to 4, "shopping" to 3,
-            "cost" to 3, "fee" to 3, "charge" to 3
-        )
-
-        for ((pattern, penalty) in exclusionPatterns) {
-            if (lowerText.contains(pattern)) {
+        for ((pattern, penalty) in EXCLUSION_PATTERNS) {
+            if (text.contains(pattern)) {
                 // Check if it's actually a savings context despite containing payment words
-                if (!isSavingsOverrideContext(lowerText, pattern)) {
+                if (!isSavingsOverrideContext(text, pattern)) {
                     savingsScore -= penalty
                     println("❌ EXCLUSION: '$pattern' detected (-$penalty)")
                 } else {
@@ -432,7 +376,7 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         }
 
         // Boost score for clear savings intent
-        if (savingsScore >= 8 && hasClearSavingsIntent(lowerText)) {
+        if (savingsScore >= 8 && hasClearSavingsIntent(text)) {
             savingsScore += 2
             println("🚀 CLEAR INTENT: High confidence savings (+2)")
         }
@@ -440,12 +384,11 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         return maxOf(0, savingsScore)
     }
 
-    private fun analyzeSavingsContext(text: String): Int {
+    private fun analyzeSavingsContext(text: ScannedText, words: List<String>): Int {
         var contextScore = 0
 
         // Time-based context (future oriented)
-        val futureWords = listOf("next month", "next year", "in future", "later", "tomorrow")
-        for (word in futureWords) {
+        for (word in FUTURE_WORDS) {
             if (text.contains(word)) {
                 contextScore += 2
                 println("⏰ FUTURE: '$word' context (+2)")
@@ -453,8 +396,7 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         }
 
         // Purpose-based context
-        val purposeWords = listOf("for vacation", "for house", "for car", "for education", "for kids")
-        for (word in purposeWords) {
+        for (word in PURPOSE_WORDS) {
             if (text.contains(word)) {
                 contextScore += 3
                 println("🎯 PURPOSE: '$word' context (+3)")
@@ -462,8 +404,7 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         }
 
         // Amount-based context (larger amounts often indicate savings)
-        val words = text.split("\\s+".toRegex())
-        val amountWords = words.filter { it.matches(Regex("\\$\\d+")) }
+        val amountWords = words.filter { it.matches(DOLLAR_AMOUNT_WORD) }
         if (amountWords.isNotEmpty()) {
             val avgAmount = amountWords.mapNotNull {
                 it.replace("$", "").toDoubleOrNull()
@@ -478,32 +419,23 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         return contextScore
     }
 
-    private fun isSavingsOverrideContext(text: String, paymentPattern: String): Boolean {
+    private fun isSavingsOverrideContext(text: ScannedText, paymentPattern: String): Boolean {
         // Check if payment pattern is actually in a savings context
-        val savingsOverrideWords = listOf(
-            "savings", "deposit", "bank", "account", "saved",
-            "emergency", "fund", "future", "invest"
-        )
-
-        return savingsOverrideWords.any { overrideWord ->
-            text.contains(overrideWord) && text.indexOf(overrideWord) > text.indexOf(paymentPattern)
+        val paymentIndex = text.text.indexOf(paymentPattern)
+        return SAVINGS_OVERRIDE_WORDS.any { overrideWord ->
+            text.contains(overrideWord) && text.text.indexOf(overrideWord) > paymentIndex
         }
     }
 
-    private fun hasClearSavingsIntent(text: String): Boolean {
+    private fun hasClearSavingsIntent(text: ScannedText): Boolean {
         // Check for multiple savings indicators
-        val savingsIndicators = listOf(
-            "savings", "deposit", "bank", "account", "emergency",
-            "fund", "future", "invest", "save", "put away"
-        )
-
-        val indicatorCount = savingsIndicators.count { text.contains(it) }
+        val indicatorCount = SAVINGS_INDICATORS.count { text.contains(it) }
         return indicatorCount >= 2 // Multiple indicators = clear intent
     }
 
-    private fun determineFinalType(incomeScore: Int, expenseScore: Int, text: String, words: List<String>): TransactionType {
+    private fun determineFinalType(incomeScore: Int, expenseScore: Int, text: ScannedText, words: List<String>): TransactionType {
         // Add savings analysis
-        val savingsScore = analyzeSavingsPatterns(text.lowercase())
+        val savingsScore = analyzeSavingsPatterns(text, words)
 
         println("🤖 SCORES - Income: $incomeScore, Expense: $expenseScore, Savings: $savingsScore")
 
@@ -545,15 +477,11 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         }
     }
 
-    private fun hasStrongSavingsContext(text: String): Boolean {
-        val strongIndicators = listOf(
-            "savings account", "emergency fund", "put away", "set aside",
-            "for future", "long term", "deposit to", "bank savings"
-        )
-        return strongIndicators.any { text.contains(it) }
+    private fun hasStrongSavingsContext(text: ScannedText): Boolean {
+        return STRONG_SAVINGS_INDICATORS.any { text.contains(it) }
     }
 
-    private fun resolveAmbiguity(incomeScore: Int, expenseScore: Int, savingsScore: Int, text: String, words: List<String>): TransactionType {
+    private fun resolveAmbiguity(incomeScore: Int, expenseScore: Int, savingsScore: Int, text: ScannedText, words: List<String>): TransactionType {
         println("🤔 AMBIGUITY: Resolving with advanced analysis...")
 
         // Check for question marks or uncertainty
@@ -569,8 +497,7 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         }
 
         // Amount-based decision (large amounts often indicate savings)
-        val amountPattern = Regex("\\$?(\\d+(?:,\\d{3})*(?:\\.\\d{2})?)")
-        val amounts = amountPattern.findAll(text).mapNotNull {
+        val amounts = AMOUNT_PATTERN.findAll(text.text).mapNotNull {
             it.groupValues[1].replace(",", "").toDoubleOrNull()
         }.toList()
 
@@ -599,24 +526,111 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
         return bestType
     }
 
-    private fun analyzeSentenceContext(text: String, words: List<String>): TransactionType {
-        if (text.contains("?") || text.contains("maybe") || text.contains("perhaps")) {
-            return TransactionType.EXPENSE
-        }
-        if (words.any { it == "not" || it == "n't" || it == "never" }) {
-            return TransactionType.EXPENSE
-        }
-        return TransactionType.EXPENSE
-    }
-
     private fun getContextWords(words: List<String>, targetIndex: Int, windowSize: Int): List<String> {
         val start = maxOf(0, targetIndex - windowSize)
         val end = minOf(words.size, targetIndex + windowSize + 1)
         return words.subList(start, end)
     }
 
-    private fun isShoppingContext(text: String, contextWords: List<String>): Boolean {
-        val shoppingIndicators = listOf(
+    private fun isShoppingContext(text: ScannedText, contextWords: List<String>): Boolean {
+        return SHOPPING_INDICATORS.any { indicator ->
+            text.contains(indicator) || contextWords.contains(indicator)
+        }
+    }
+
+    private fun isReceivingMoneyContext(text: ScannedText, contextWords: List<String>): Boolean {
+        return MONEY_RECEIVING_INDICATORS.any { indicator ->
+            text.contains(indicator) || contextWords.contains(indicator)
+        }
+    }
+
+    private data class ScoreResult(val incomeScore: Int, val expenseScore: Int)
+
+    /**
+     * Static keyword tables, built once per process instead of on every analysis call
+     */
+    companion object {
+        private val DIRECT_INCOME_WORDS = listOf(
+            "income", "salary", "earning", "revenue", "profit", "bonus", "commission"
+        )
+
+        private val DIRECT_EXPENSE_WORDS = listOf("expense", "cost", "spending", "payment", "bill", "fee")
+
+        private val LOSS_WORDS = listOf("lost", "missing", "stolen", "theft", "robbed", "gone", "disappeared")
+
+        private val GIFT_WORDS = listOf("gift", "present", "donation", "prize", "award", "bonus", "reward")
+
+        private val MONEY_TO_ME_PATTERNS = listOf("gave me", "gave to me", "lent me", "paid me", "sent me")
+        private val MONEY_FROM_ME_PATTERNS = listOf("gave away", "lent to", "paid to", "sent to")
+
+        // Shared by direct expense detection and possessive context analysis
+        private val SHOPPING_KEYWORDS = listOf("shopping", "shop", "bought", "purchase", "buy")
+
+        private val PREPOSITIONS = setOf("to", "from", "by", "with", "for")
+
+        private val ACTION_VERBS = setOf("got", "gave", "paid", "received", "spent", "bought", "sent", "earned")
+
+        private val FAMILY_WORDS = listOf(
+            "father", "mother", "dad", "mom", "parent", "brother", "sister", "son", "daughter",
+            "uncle", "aunt", "grandfather", "grandmother"
+        )
+
+        private val RECEIVING_PATTERNS = listOf(
+            "got from", "received from", "got money", "money came",
+            "came from", "transfer to me", "deposit to",
+            "gift from", "present from", "donation from", "prize from",
+            "money from", "cash from", "payment from"
+        )
+
+        private val GIVING_PATTERNS = listOf(
+            "gave away", "paid out", "spent for", "cost for",
+            "transfer from", "withdrawal", "paid off"
+        )
+
+        private val BASIC_INCOME_VERBS = listOf("received", "earned", "got")
+        private val BASIC_EXPENSE_VERBS = listOf("paid", "spent", "bought")
+
+        private val SAVINGS_KEYWORDS = mapOf(
+            "sav" to 2, "saving" to 2, "saved" to 3, "savings" to 4,
+            "deposit" to 3, "deposited" to 4, "bank" to 2, "account" to 2,
+            "put away" to 4, "set aside" to 4, "emergency" to 3, "fund" to 3,
+            "future" to 3, "long term" to 3, "accumulate" to 3, "build" to 2,
+            "invest" to 2, "investment" to 3, "retirement" to 3, "pension" to 3
+        )
+
+        private val BANK_PATTERNS = listOf(
+            "to bank" to 4, "to savings" to 5, "to account" to 4,
+            "into savings" to 5, "into bank" to 4, "into account" to 4,
+            "bank account" to 3, "savings account" to 4,
+            "transfer to savings" to 5, "moved to bank" to 4
+        )
+
+        private val EXCLUSION_PATTERNS = listOf(
+            "paid bill" to 5, "paid rent" to 5, "paid utilities" to 5,
+            "paid debt" to 5, "paid loan" to 5, "paid credit" to 5,
+            "bought" to 4, "purchase" to 4, "shopping" to 3,
+            "cost" to 3, "fee" to 3, "charge" to 3
+        )
+
+        private val FUTURE_WORDS = listOf("next month", "next year", "in future", "later", "tomorrow")
+        private val PURPOSE_WORDS = listOf("for vacation", "for house", "for car", "for education", "for kids")
+
+        private val SAVINGS_OVERRIDE_WORDS = listOf(
+            "savings", "deposit", "bank", "account", "saved",
+            "emergency", "fund", "future", "invest"
+        )
+
+        private val SAVINGS_INDICATORS = listOf(
+            "savings", "deposit", "bank", "account", "emergency",
+            "fund", "future", "invest", "save", "put away"
+        )
+
+        private val STRONG_SAVINGS_INDICATORS = listOf(
+            "savings account", "emergency fund", "put away", "set aside",
+            "for future", "long term", "deposit to", "bank savings"
+        )
+
+        private val SHOPPING_INDICATORS = listOf(
             "market", "store", "shop", "shopping", "bought", "purchase", "buy",
             "bag", "item", "product", "goods", "mall", "supermarket", "grocery",
             "clothes", "food", "vegetables", "fruits", "went to", "for myself",
@@ -627,21 +641,34 @@ class TransactionTypeAnalyzer : TransactionTypeAnalyzerInterface {
             "pharmacy", "drugstore", "cosmetics", "beauty", "jewelry",
             "shoes", "accessories", "handbag", "wallet", "perfume", "cologne"
         )
-        return shoppingIndicators.any { indicator ->
-            text.contains(indicator) || contextWords.contains(indicator)
-        }
-    }
 
-    private fun isReceivingMoneyContext(text: String, contextWords: List<String>): Boolean {
-        val moneyReceivingIndicators = listOf(
+        private val MONEY_RECEIVING_INDICATORS = listOf(
             "from", "money", "cash", "rupees", "dollars", "received", "gave me",
             "paid me", "lent me", "transfer", "deposit", "salary", "payment",
             "gift", "present", "donation", "prize", "award", "bonus", "reward"
         )
-        return moneyReceivingIndicators.any { indicator ->
-            text.contains(indicator) || contextWords.contains(indicator)
-        }
-    }
 
-    private data class ScoreResult(val incomeScore: Int, val expenseScore: Int)
+        private val WHITESPACE = Regex("\\s+")
+
+        // Amount regexes, compiled once instead of on every call
+        private val DOLLAR_AMOUNT_WORD = Regex("\\$\\d+")
+        private val AMOUNT_PATTERN = Regex("\\$?(\\d+(?:,\\d{3})*(?:\\.\\d{2})?)")
+
+        // Individual keywords checked inline by the analyzers above
+        private val CONTEXT_KEYWORDS = listOf(
+            "got", "received", "money", "gave to", "for myself", "for me",
+            "went to market", "?", "maybe", "perhaps"
+        )
+
+        // Declared last so every table above is initialized before the automaton is built
+        private val KEYWORD_MATCHER = KeywordMatcher(
+            DIRECT_INCOME_WORDS + DIRECT_EXPENSE_WORDS + LOSS_WORDS + GIFT_WORDS +
+                MONEY_TO_ME_PATTERNS + MONEY_FROM_ME_PATTERNS + SHOPPING_KEYWORDS +
+                FAMILY_WORDS + RECEIVING_PATTERNS + GIVING_PATTERNS +
+                SAVINGS_KEYWORDS.keys + BANK_PATTERNS.map { it.first } +
+                EXCLUSION_PATTERNS.map { it.first } + FUTURE_WORDS + PURPOSE_WORDS +
+                SAVINGS_OVERRIDE_WORDS + SAVINGS_INDICATORS + STRONG_SAVINGS_INDICATORS +
+                SHOPPING_INDICATORS + MONEY_RECEIVING_INDICATORS + CONTEXT_KEYWORDS
+        )
+    }
 }
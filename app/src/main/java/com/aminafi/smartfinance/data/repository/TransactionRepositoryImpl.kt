@@ -36,7 +36,6 @@ class TransactionRepositoryImpl(
 
     override suspend fun updateTransaction(transaction: Transaction) {
         val entity = TransactionEntity.fromTransaction(transaction)
-        transactionDao.deleteTransaction(entity) // Delete old
-        transactionDao.insertTransaction(entity) // Insert updated
+        transactionDao.updateTransaction(entity)
     }
 }
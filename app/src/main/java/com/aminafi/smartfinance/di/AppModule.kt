@@ -12,8 +12,6 @@ import com.aminafi.smartfinance.domain.usecase.ProcessAIMessageUseCase
 import com.aminafi.smartfinance.domain.usecase.ProcessAIMessageUseCaseImpl
 import org.koin.android.ext.koin.androidContext
 import org.koin.androidx.viewmodel.dsl.viewModel
-import org.koin.core.module.dsl.factoryOf
-import org.koin.core.module.dsl.singleOf
 import org.koin.dsl.module
 
 /**
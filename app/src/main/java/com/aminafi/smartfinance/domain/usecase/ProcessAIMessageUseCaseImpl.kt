@@ -12,14 +12,18 @@ class ProcessAIMessageUseCaseImpl(
 ) : ProcessAIMessageUseCase {
 
     override suspend operator fun invoke(message: String): Result<AIDetectedTransaction> {
-        println("🤖 AI Processing: '$message'")
-        println("   Using: ${aiService::class.simpleName} (pattern-based analysis)")
+        println(
+            "🤖 AI Processing: '$message'\n" +
+            "   Using: ${aiService::class.simpleName} (pattern-based analysis)"
+        )
 
         val result = aiService.detectTransaction(message)
         result.onSuccess { transaction ->
-            println("✅ AI Result: ${transaction.type} - $${transaction.amount} (${(transaction.confidence * 100).toInt()}% confidence)")
-            println("   Title: ${transaction.title}")
-            println("   Description: ${transaction.description}")
+            println(
+                "✅ AI Result: ${transaction.type} - $${transaction.amount} (${(transaction.confidence * 100).toInt()}% confidence)\n" +
+                "   Title: ${transaction.title}\n" +
+                "   Description: ${transaction.description}"
+            )
         }
         result.onFailure { error ->
             println("❌ AI Error: ${error.message}")
@@ -35,11 +35,12 @@ fun FinanceApp(viewModel: FinanceViewModel = koinViewModel()) {
     val coroutineScope = rememberCoroutineScope()
     val snackbarHostState = remember { SnackbarHostState() }
 
-    val summary = viewModel.getMonthlySummary(transactions, allTransactions)
     val (currentMonthName, currentYear, fullDate) = viewModel.getCurrentDateInfo()
-    val selectedMonthName = SimpleDateFormat("MMMM", Locale.getDefault()).format(
-        Calendar.getInstance().apply { set(Calendar.MONTH, selectedMonth) }.time
-    )
+    val selectedMonthName = remember(selectedMonth) {
+        SimpleDateFormat("MMMM", Locale.getDefault()).format(
+            Calendar.getInstance().apply { set(Calendar.MONTH, selectedMonth) }.time
+        )
+    }
 
     Scaffold(
         snackbarHost = {
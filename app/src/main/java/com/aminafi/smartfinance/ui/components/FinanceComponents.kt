@@ -10,7 +10,6 @@ import androidx.compose.ui.graphics.Color
 import androidx.compose.ui.text.font.FontWeight
 import androidx.compose.ui.unit.dp
 import com.aminafi.smartfinance.FinancialSummary
-import com.aminafi.smartfinance.Transaction
 
 @Composable
 fun MonthlySummary(summary: FinancialSummary) {
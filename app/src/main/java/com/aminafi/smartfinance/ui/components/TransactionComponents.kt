@@ -6,6 +6,7 @@ import androidx.compose.foundation.lazy.LazyColumn
 import androidx.compose.foundation.lazy.items
 import androidx.compose.material3.*
 import androidx.compose.runtime.Composable
+import androidx.compose.runtime.remember
 import androidx.compose.ui.Alignment
 import androidx.compose.ui.Modifier
 import androidx.compose.ui.graphics.Color
@@ -18,15 +19,18 @@ import java.util.*
 
 @Composable
 fun TransactionList(transactions: List<Transaction>) {
+    // One formatter for the whole list instead of one per row per recomposition
+    val dateFormat = remember { SimpleDateFormat("MMM dd", Locale.getDefault()) }
+
     LazyColumn {
         items(transactions) { transaction ->
-            TransactionItem(transaction)
+            TransactionItem(transaction, dateFormat)
         }
     }
 }
 
 @Composable
-fun TransactionItem(transaction: Transaction) {
+fun TransactionItem(transaction: Transaction, dateFormat: SimpleDateFormat) {
     Card(
         modifier = Modifier
             .fillMaxWidth()
@@ -45,7 +49,7 @@ fun TransactionItem(transaction: Transaction) {
                     style = MaterialTheme.typography.bodyLarge
                 )
                 Text(
-                    text = SimpleDateFormat("MMM dd", Locale.getDefault()).format(transaction.date),
+                    text = dateFormat.format(transaction.date),
                     style = MaterialTheme.typography.bodySmall
                 )
             }
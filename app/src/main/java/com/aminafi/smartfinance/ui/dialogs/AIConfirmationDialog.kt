@@ -5,7 +5,6 @@ import androidx.compose.material3.*
 import androidx.compose.runtime.*
 import androidx.compose.ui.Modifier
 import androidx.compose.ui.unit.dp
-import com.aminafi.smartfinance.TransactionType
 import com.aminafi.smartfinance.ai.AIDetectedTransaction
 import com.aminafi.smartfinance.ui.components.TransactionForm
 import com.aminafi.smartfinance.ui.components.TransactionFormData
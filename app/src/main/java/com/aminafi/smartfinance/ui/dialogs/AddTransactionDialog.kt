@@ -11,7 +11,6 @@ import androidx.compose.ui.Modifier
 import androidx.compose.ui.text.font.FontWeight
 import androidx.compose.ui.unit.dp
 import com.aminafi.smartfinance.Transaction
-import com.aminafi.smartfinance.TransactionType
 import com.aminafi.smartfinance.ui.components.TransactionForm
 import com.aminafi.smartfinance.ui.components.TransactionFormData
 import com.aminafi.smartfinance.ui.components.isValid
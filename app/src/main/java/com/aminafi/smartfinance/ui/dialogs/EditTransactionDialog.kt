@@ -3,11 +3,9 @@ package com.aminafi.smartfinance.ui.dialogs
 import androidx.compose.foundation.layout.*
 import androidx.compose.material3.*
 import androidx.compose.runtime.*
-import androidx.compose.ui.Alignment
 import androidx.compose.ui.Modifier
 import androidx.compose.ui.unit.dp
 import com.aminafi.smartfinance.Transaction
-import com.aminafi.smartfinance.TransactionType
 import com.aminafi.smartfinance.ui.components.TransactionForm
 import com.aminafi.smartfinance.ui.components.TransactionFormData
 import com.aminafi.smartfinance.ui.components.isValid
@@ -1,14 +1,9 @@
 package com.aminafi.smartfinance.ui.screens
 
 import androidx.compose.foundation.layout.*
-import androidx.compose.foundation.lazy.LazyColumn
-import androidx.compose.foundation.lazy.items
 import androidx.compose.material3.*
 import androidx.compose.runtime.*
-import androidx.compose.ui.Alignment
 import androidx.compose.ui.Modifier
-import androidx.compose.ui.graphics.Color
-import androidx.compose.ui.text.font.FontWeight
 import androidx.compose.ui.unit.dp
 import com.aminafi.smartfinance.*
 import com.aminafi.smartfinance.ai.AIDetectedTransaction
@@ -16,10 +11,6 @@ import com.aminafi.smartfinance.ui.components.*
 import kotlinx.coroutines.launch
 import androidx.compose.material3.SnackbarDuration
 import androidx.compose.material3.SnackbarHostState
-import androidx.compose.foundation.rememberScrollState
-import androidx.compose.foundation.verticalScroll
-import androidx.compose.ui.text.input.KeyboardType
-import java.text.SimpleDateFormat
 import java.util.*
 
 @OptIn(ExperimentalMaterial3Api::class)
@@ -39,7 +30,10 @@ fun HomeScreen(
     onShowAddTransactionDialog: (Transaction) -> Unit,
     onShowAIConfirmationDialog: (AIDetectedTransaction) -> Unit
 ) {
-    val summary = viewModel.getMonthlySummary(transactions, allTransactions)
+    // Recompute totals only when the transaction lists change, not on every keystroke
+    val summary = remember(transactions, allTransactions) {
+        viewModel.getMonthlySummary(transactions, allTransactions)
+    }
     var message by remember { mutableStateOf("") }
     val coroutineScope = rememberCoroutineScope()
 
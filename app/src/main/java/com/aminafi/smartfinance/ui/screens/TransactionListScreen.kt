@@ -6,6 +6,7 @@ import androidx.compose.foundation.lazy.LazyColumn
 import androidx.compose.foundation.lazy.items
 import androidx.compose.material3.*
 import androidx.compose.runtime.Composable
+import androidx.compose.runtime.remember
 import androidx.compose.ui.Alignment
 import androidx.compose.ui.Modifier
 import androidx.compose.ui.graphics.Color
@@ -24,6 +25,9 @@ fun TransactionListScreen(
     onBack: () -> Unit,
     onEditTransaction: (Transaction) -> Unit
 ) {
+    // One formatter for the whole list instead of one per row per recomposition
+    val dateFormat = remember { SimpleDateFormat("MMM dd, yyyy", Locale.getDefault()) }
+
     Scaffold(
         topBar = {
             TopAppBar(
@@ -55,6 +59,7 @@ fun TransactionListScreen(
             items(transactions) { transaction ->
                 TransactionItemEditable(
                     transaction = transaction,
+                    dateFormat = dateFormat,
                     onClick = { onEditTransaction(transaction) }
                 )
             }
@@ -65,6 +70,7 @@ fun TransactionListScreen(
 @Composable
 fun TransactionItemEditable(
     transaction: Transaction,
+    dateFormat: SimpleDateFormat,
     onClick: () -> Unit
 ) {
     Card(
@@ -91,7 +97,7 @@ fun TransactionItemEditable(
                 )
                 Spacer(modifier = Modifier.height(4.dp))
                 Text(
-                    text = SimpleDateFormat("MMM dd, yyyy", Locale.getDefault()).format(transaction.entryDate),
+                    text = dateFormat.format(transaction.entryDate),
                     style = MaterialTheme.typography.bodySmall,
                     color = MaterialTheme.colorScheme.onSurfaceVariant
                 )
@@ -0,0 +1,49 @@
+package com.aminafi.smartfinance
+
+import com.aminafi.smartfinance.ai.analyzers.KeywordMatcher
+import org.junit.Test
+import org.junit.Assert.*
+
+/**
+ * Test to verify single-pass keyword matching agrees with String.contains
+ */
+class KeywordMatcherTest {
+
+    private val keywords = listOf("gave me", "gave to", "gave to me", "me", "save", "savings", "sav", "bank account")
+    private val matcher = KeywordMatcher(keywords)
+
+    @Test
+    fun testMatchesAgreeWithContains() {
+        val texts = listOf(
+            "my father gave me 500",
+            "gave to me 20 dollars",
+            "put 300 into savings account",
+            "moved 1000 to bank account",
+            "",
+            "lunch 15"
+        )
+
+        for (text in texts) {
+            val scanned = matcher.scan(text)
+            for (keyword in keywords) {
+                assertEquals("'$keyword' in '$text'", text.contains(keyword), keyword in scanned)
+            }
+        }
+    }
+
+    @Test
+    fun testOverlappingKeywords() {
+        // "sav" and "save" share a trie path with "savings"; only real substrings may match
+        val scanned = matcher.scan("savings")
+        assertTrue("sav" in scanned)
+        assertTrue("savings" in scanned)
+        assertFalse("save" in scanned)
+    }
+
+    @Test
+    fun testUnregisteredKeywordFallsBackToContains() {
+        val scanned = matcher.scan("paid rent 900")
+        assertTrue("rent" in scanned)
+        assertFalse("salary" in scanned)
+    }
+}